@@ -99,6 +99,12 @@ def from_config(config_path: str | Path) -> AuditResult:
     import pandas as pd
     import yaml
 
+    # libyaml's C loader parses several times faster; same safe tag set as SafeLoader
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as YamlLoader
+
     from glassalpha.utils.canonicalization import hash_data_for_manifest
 
     # Load YAML config
@@ -109,7 +115,7 @@ def from_config(config_path: str | Path) -> AuditResult:
 
     try:
         with open(config_path_obj) as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML syntax in {config_path_obj}\n\nError: {e}") from e
 
@@ -34,6 +34,12 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+# libyaml's C loader parses several times faster; same safe tag set as SafeLoader
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class ModelConfig(BaseModel):
     """Model configuration."""
@@ -85,6 +91,32 @@ class PreprocessingConfig(BaseModel):
 
     mode: str = Field("auto", description="Preprocessing mode: auto, artifact, or none")
     artifact_path: Path | None = Field(None, description="Path to preprocessing artifact (.joblib)")
+    expected_file_hash: str | None = Field(None, description="Expected artifact file hash (sha256:...)")
+    expected_params_hash: str | None = Field(None, description="Expected learned-parameters hash (sha256:...)")
+    expected_sparse: bool | None = Field(None, description="Expected output sparsity (None = skip check)")
+    fail_on_mismatch: bool = Field(True, description="Fail the audit on hash mismatch instead of warning")
+
+    @classmethod
+    def _validate_strict_hashes(cls, values: dict[str, Any]) -> None:
+        """Require both artifact hashes when strict mode uses artifact preprocessing.
+
+        Operates on plain values so callers can check a section without
+        building a full AuditConfig.
+
+        Raises:
+            ValueError: If mode is 'artifact' and either expected hash is missing
+
+        """
+        if values.get("mode") != "artifact":
+            return
+
+        missing = [key for key in ("expected_file_hash", "expected_params_hash") if not values.get(key)]
+        if missing:
+            raise ValueError(
+                f"Strict mode requires preprocessing hashes: missing {', '.join(missing)}\n\n"
+                f"Compute them with glassalpha.preprocessing.compute_file_hash() and\n"
+                f"compute_params_hash(), then set them under 'preprocessing:' in your config."
+            )
 
 
 class ReportConfig(BaseModel):
@@ -307,7 +339,7 @@ def load_config(
 
     try:
         with open(config_path, encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(
             f"Invalid YAML syntax in {config_path}\n\n"
@@ -394,7 +426,7 @@ def load_yaml(config_path: str | Path) -> dict[str, Any]:
         )
 
     with open(config_path, encoding="utf-8") as f:
-        result = yaml.safe_load(f)
+        result = yaml.load(f, Loader=_YamlLoader)
         return result if result is not None else {}
 
 
@@ -476,6 +508,11 @@ def _validate_strict_mode(config: AuditConfig) -> None:
     if not config.explainers.priority:
         errors.append("Explicit explainer priority is required in strict mode")
 
+    try:
+        PreprocessingConfig._validate_strict_hashes(config.preprocessing.model_dump())
+    except ValueError as e:
+        errors.append(str(e))
+
     # Additional strict mode validations could be added here
 
     if errors:
@@ -5,6 +5,7 @@ Replaces registry pattern with simple if/elif dispatch.
 
 from __future__ import annotations
 
+import functools
 import logging
 from typing import Any
 
@@ -31,7 +32,23 @@ def select_explainer(model_type: str, requested_priority: list[str] | None = Non
 
     """
     model_type = model_type.lower()
+    priority = tuple(requested_priority) if requested_priority else ()
 
+    # Selection is a pure function of (model_type, priority); the cached helper
+    # avoids re-probing optional dependencies while we still log every call.
+    result, reason = _select_explainer_cached(model_type, priority)
+    logger.info(f"Explainer: selected {result} for {model_type}{reason}")
+    return result
+
+
+@functools.lru_cache(maxsize=128)
+def _select_explainer_cached(model_type: str, priority: tuple[str, ...]) -> tuple[str, str]:
+    """Resolve the explainer for a normalized model type and priority tuple.
+
+    Returns:
+        Tuple of (explainer name, log suffix describing how it was chosen)
+
+    """
     # Define available explainers for each model type
     explainer_options = {
         "xgboost": ["treeshap", "kernelshap"],
@@ -49,9 +66,9 @@ def select_explainer(model_type: str, requested_priority: list[str] | None = Non
     available_explainers = explainer_options.get(model_type, ["kernelshap"])
 
     # If priority is requested, use it; otherwise use defaults
-    if requested_priority:
+    if priority:
         # Filter requested priority to only include available explainers
-        valid_priority = [p for p in requested_priority if p in available_explainers]
+        valid_priority = [p for p in priority if p in available_explainers]
         if valid_priority:
             # Check if the first priority explainer is actually available
             first_choice = valid_priority[0]
@@ -62,47 +79,35 @@ def select_explainer(model_type: str, requested_priority: list[str] | None = Non
                     import importlib.util
 
                     if importlib.util.find_spec("glassalpha.explain.shap") is not None:
-                        logger.info(f"Explainer: selected {first_choice} for {model_type} (priority)")
-                        return first_choice
+                        return first_choice, " (priority)"
                     raise ImportError("TreeSHAP not available")
                 except ImportError:
                     # Try next priority or fall back to default
                     if len(valid_priority) > 1:
                         next_choice = valid_priority[1]
                         if next_choice in {"kernelshap", "coefficients"}:
-                            logger.info(f"Explainer: selected {next_choice} for {model_type} (priority fallback)")
-                            return next_choice
+                            return next_choice, " (priority fallback)"
             elif first_choice == "kernelshap":
                 # KernelSHAP is always available in our stub
-                logger.info(f"Explainer: selected {first_choice} for {model_type} (priority)")
-                return first_choice
+                return first_choice, " (priority)"
             elif first_choice == "coefficients":
-                logger.info(f"Explainer: selected {first_choice} for {model_type} (priority)")
-                return first_choice
+                return first_choice, " (priority)"
 
         # If no valid priority, raise error
-        raise RuntimeError(f"No explainer from {requested_priority} is available for {model_type}")
+        raise RuntimeError(f"No explainer from {list(priority)} is available for {model_type}")
 
     # Default selection logic
     if model_type in ("xgboost", "lightgbm", "xgb", "lgb", "lgbm", "random_forest"):
         try:
-            result = "treeshap"
-            logger.info(f"Explainer: selected {result} for {model_type}")
-            return result
+            return "treeshap", ""
         except ImportError:
-            result = "kernelshap"
-            logger.info(f"Explainer: selected {result} for {model_type} (fallback)")
-            return result
+            return "kernelshap", " (fallback)"
 
     if model_type in ("logistic_regression", "logistic", "linear"):
-        result = "coefficients"
-        logger.info(f"Explainer: selected {result} for {model_type}")
-        return result
+        return "coefficients", ""
 
     # Default fallback
-    result = "kernelshap"
-    logger.info(f"Explainer: selected {result} for {model_type}")
-    return result
+    return "kernelshap", ""
 
 
 def _available(explainer_name: str) -> bool:
@@ -29,4 +29,8 @@ class PassThroughModel(BaseEstimator, ClassifierMixin):
     def predict_proba(self, X):
         """Predict high probability for positive class."""
         n_samples = X.shape[0] if hasattr(X, "shape") else len(X) if hasattr(X, "__len__") else 1
-        return np.array([[0.1, 0.9]] * n_samples)
+        # Fill a preallocated float32 array (half the bytes of float64) instead of a list of rows
+        proba = np.empty((n_samples, 2), dtype=np.float32)
+        proba[:, 0] = 0.1
+        proba[:, 1] = 0.9
+        return proba
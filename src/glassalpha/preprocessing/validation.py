@@ -1,5 +1,7 @@
 """Validation functions for preprocessing artifacts."""
 
+import functools
+import re
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +20,19 @@ ALLOWED_FQCN = {
 }
 
 
+# Leading numeric release segments, e.g. "1.5.2" or "2.0rc1" -> (2, 0)
+_VERSION_RE = re.compile(r"^(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_version(version: str) -> tuple[int, ...] | None:
+    """Parse the numeric release segments of a version string (cached)."""
+    match = _VERSION_RE.match(version)
+    if match is None:
+        return None
+    return tuple(int(part) for part in match.groups() if part is not None)
+
+
 def fqcn(obj: Any) -> str:
     """Get fully-qualified class name (module + class)."""
     cls = obj.__class__
@@ -161,12 +176,10 @@ def assert_runtime_versions(manifest: dict[str, Any], strict: bool, allow_minor:
             # Always record mismatches, but check if they're acceptable
             is_minor_drift = False
             if allow_minor:
-                try:
-                    artifact_major = artifact_ver.split(".")[0]
-                    audit_major = audit_ver.split(".")[0]
-                    is_minor_drift = artifact_major == audit_major
-                except Exception:
-                    pass
+                artifact_parsed = _parse_version(str(artifact_ver))
+                audit_parsed = _parse_version(str(audit_ver))
+                if artifact_parsed and audit_parsed:
+                    is_minor_drift = artifact_parsed[0] == audit_parsed[0]
 
             # In strict mode, minor drift is only acceptable if allow_minor=True
             # In non-strict mode, always warn but don't fail
@@ -1,12 +1,14 @@
 """Provenance tracking for audit reproducibility."""
 
 from .run_manifest import (
+    compute_manifest_hash,
     generate_run_manifest,
     get_manifest_summary,
     write_manifest_sidecar,
 )
 
 __all__ = [
+    "compute_manifest_hash",
     "generate_run_manifest",
     "get_manifest_summary",
     "write_manifest_sidecar",
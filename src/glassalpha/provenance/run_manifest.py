@@ -105,13 +105,30 @@ def generate_run_manifest(
     manifest["constraints"] = _get_constraints_provenance()
 
     # Overall manifest hash (excluding timestamps and this field for determinism)
-    manifest_for_hash = _prepare_manifest_for_hash(manifest)
-    manifest["manifest_hash"] = _compute_dict_hash(manifest_for_hash)
+    manifest["manifest_hash"] = compute_manifest_hash(manifest)
 
     logger.info(f"Run manifest generated with {len(manifest)} sections")
     return manifest
 
 
+def compute_manifest_hash(manifest: dict[str, Any]) -> str:
+    """Compute the deterministic hash of a run manifest.
+
+    Timestamps and any existing ``manifest_hash`` field are excluded, so the
+    hash recorded in a manifest can be re-derived from the manifest alone.
+
+    Args:
+        manifest: Run manifest as produced by generate_run_manifest
+
+    Returns:
+        SHA-256 hex digest of the manifest content
+
+    """
+    manifest_for_hash = _prepare_manifest_for_hash(manifest)
+    manifest_for_hash.pop("manifest_hash", None)
+    return _compute_dict_hash(manifest_for_hash)
+
+
 def _get_glassalpha_version() -> str:
     """Get GlassAlpha version information."""
     try:
@@ -15,6 +15,7 @@ Usage:
         pdf = generate_report(audit_results)
 """
 
+import functools
 import hashlib
 import logging
 import os
@@ -31,6 +32,21 @@ from glassalpha.utils.seeds import set_global_seed
 
 logger = logging.getLogger(__name__)
 
+# BLAS/LAPACK/OpenMP thread-count variables pinned to 1 in strict mode
+_THREAD_ENV_KEYS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Every variable deterministic() may set, snapshotted on entry and restored on exit
+_MANAGED_ENV_KEYS = ("PYTHONHASHSEED", "GLASSALPHA_DETERMINISTIC", *_THREAD_ENV_KEYS)
+
+# Variables inspected by validate_deterministic_environment(), hash seed first
+_VALIDATED_ENV_KEYS = ("PYTHONHASHSEED", "OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
 
 def get_deterministic_timestamp(seed: int | None = None) -> datetime:
     """Get a deterministic timestamp for reproducible builds.
@@ -106,36 +122,28 @@ def deterministic(seed: int, *, strict: bool = True) -> Generator[None, None, No
 
     """
     # Save original environment
-    original_env = {
-        "PYTHONHASHSEED": os.environ.get("PYTHONHASHSEED"),
-        "OMP_NUM_THREADS": os.environ.get("OMP_NUM_THREADS"),
-        "OPENBLAS_NUM_THREADS": os.environ.get("OPENBLAS_NUM_THREADS"),
-        "MKL_NUM_THREADS": os.environ.get("MKL_NUM_THREADS"),
-        "BLIS_NUM_THREADS": os.environ.get("BLIS_NUM_THREADS"),
-        "NUMEXPR_NUM_THREADS": os.environ.get("NUMEXPR_NUM_THREADS"),
-        "GLASSALPHA_DETERMINISTIC": os.environ.get("GLASSALPHA_DETERMINISTIC"),
-    }
+    original_env = {key: os.environ.get(key) for key in _MANAGED_ENV_KEYS}
 
     # Save original random states
     original_random_state = random.getstate()
     original_numpy_state = np.random.get_state()
 
     try:
-        # Set environment variables for determinism
-        os.environ["PYTHONHASHSEED"] = str(seed)
-        os.environ["GLASSALPHA_DETERMINISTIC"] = str(seed)  # Signal deterministic mode
+        # Set environment variables for determinism in a single update
+        deterministic_env = {
+            "PYTHONHASHSEED": str(seed),
+            "GLASSALPHA_DETERMINISTIC": str(seed),  # Signal deterministic mode
+        }
 
         if strict:
             # Force single-threaded BLAS/LAPACK for determinism
             # These must be set before numpy/scipy imports, but we set them anyway
-            os.environ["OMP_NUM_THREADS"] = "1"
-            os.environ["OPENBLAS_NUM_THREADS"] = "1"
-            os.environ["MKL_NUM_THREADS"] = "1"
-            os.environ["BLIS_NUM_THREADS"] = "1"
-            os.environ["NUMEXPR_NUM_THREADS"] = "1"
+            deterministic_env.update(dict.fromkeys(_THREAD_ENV_KEYS, "1"))
 
             logger.debug("Enforcing single-threaded BLAS/LAPACK for determinism")
 
+        os.environ.update(deterministic_env)
+
         # Set all random seeds using centralized seed manager
         set_global_seed(seed)
 
@@ -177,11 +185,17 @@ def _enforce_numpy_determinism() -> None:
 
 
 def compute_file_hash(file_path: Path | str, algorithm: str = "sha256") -> str:
-    """Compute cryptographic hash of file for verification.
+    """Compute a hash of a file for verification.
+
+    The default (sha256) is cryptographic and suitable for manifests. 'xxh3' is a
+    fast non-cryptographic digest for comparing files produced in the same
+    environment; it needs the optional ``glassalpha[fast_hash]`` extra and falls
+    back to sha256 (with a warning) when xxhash is missing, so xxh3 digests must
+    never be compared across environments.
 
     Args:
         file_path: Path to file to hash
-        algorithm: Hash algorithm ('sha256', 'sha512', 'md5')
+        algorithm: Hash algorithm ('sha256', 'sha512', 'md5', ...) or 'xxh3'
 
     Returns:
         Hexadecimal hash digest
@@ -197,31 +211,44 @@ def compute_file_hash(file_path: Path | str, algorithm: str = "sha256") -> str:
         raise FileNotFoundError(f"File not found: {file_path}")
 
     # Get hash function
-    try:
-        hash_func = hashlib.new(algorithm)
-    except ValueError as e:
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
+    if algorithm == "xxh3":
+        try:
+            import xxhash
 
-    # Read and hash file in chunks for memory efficiency
-    with file_path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            hash_func.update(chunk)
+            hash_func = xxhash.xxh3_64()
+        except ImportError:
+            logger.warning(
+                "xxhash not installed (pip install 'glassalpha[fast_hash]'); 'xxh3' digests are sha256 in this "
+                "environment and must not be compared with digests from other environments"
+            )
+            hash_func = hashlib.sha256()
+    else:
+        try:
+            hash_func = hashlib.new(algorithm)
+        except ValueError as e:
+            raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
 
-    return hash_func.hexdigest()
+    # Stream the file through the hash (bounded memory, no Python-level chunk loop)
+    with file_path.open("rb") as f:
+        return hashlib.file_digest(f, lambda: hash_func).hexdigest()
 
 
 def verify_deterministic_output(
     path1: Path | str,
     path2: Path | str,
     *,
-    algorithm: str = "sha256",
+    algorithm: str = "blake2b",
 ) -> tuple[bool, str, str]:
     """Verify two files are byte-identical.
 
+    Only equality matters here, so the default is BLAKE2b, which is faster
+    than SHA-256 on hardware without SHA extensions. Use compute_file_hash
+    (SHA-256) for hashes recorded in manifests.
+
     Args:
         path1: First file path
         path2: Second file path
-        algorithm: Hash algorithm to use
+        algorithm: Hash algorithm to use (default: blake2b)
 
     Returns:
         Tuple of (are_identical, hash1, hash2)
@@ -246,52 +273,79 @@ def validate_deterministic_environment(*, strict: bool = False) -> dict[str, Any
         RuntimeError: If strict=True and critical issues found
 
     """
+    # Checks depend only on these variables, so results are memoized on their values
+    env_values = tuple(os.environ.get(var) for var in _VALIDATED_ENV_KEYS)
+    status, warnings, errors, checks = _validate_environment(env_values)
+
+    # Fresh mutable copies so callers cannot corrupt the cached result
     results: dict[str, Any] = {
-        "status": "pass",
-        "warnings": [],
-        "errors": [],
-        "checks": {},
+        "status": status,
+        "warnings": list(warnings),
+        "errors": list(errors),
+        "checks": dict(checks),
     }
 
+    # Strict mode enforcement
+    if strict and (results["errors"] or results["warnings"]):
+        raise RuntimeError(
+            f"Deterministic environment validation failed in strict mode:\n"
+            f"Errors: {results['errors']}\n"
+            f"Warnings: {results['warnings']}",
+        )
+
+    return results
+
+
+@functools.lru_cache(maxsize=16)
+def _validate_environment(
+    env_values: tuple[str | None, ...],
+) -> tuple[str, tuple[str, ...], tuple[str, ...], tuple[tuple[str, bool], ...]]:
+    """Run the environment checks for one set of variable values.
+
+    Args:
+        env_values: Values of _VALIDATED_ENV_KEYS, in order (None if unset)
+
+    Returns:
+        Immutable (status, warnings, errors, checks) tuple
+
+    """
+    env = dict(zip(_VALIDATED_ENV_KEYS, env_values, strict=True))
+    warnings: list[str] = []
+    errors: list[str] = []
+    checks: dict[str, bool] = {}
+
     # Check PYTHONHASHSEED
-    hashseed = os.environ.get("PYTHONHASHSEED")
+    hashseed = env["PYTHONHASHSEED"]
     if hashseed is None or hashseed == "random":
         msg = "PYTHONHASHSEED not set or random - hash ordering non-deterministic"
-        results["warnings"].append(msg)
-        results["checks"]["pythonhashseed"] = False
+        warnings.append(msg)
+        checks["pythonhashseed"] = False
     else:
-        results["checks"]["pythonhashseed"] = True
+        checks["pythonhashseed"] = True
 
     # Check BLAS threading
-    threading_vars = ["OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"]
-    for var in threading_vars:
-        value = os.environ.get(var)
+    for var in _VALIDATED_ENV_KEYS[1:]:
+        value = env[var]
         if value is None:
             msg = f"{var} not set - BLAS may use multiple threads (non-deterministic)"
-            results["warnings"].append(msg)
-            results["checks"][var.lower()] = False
+            warnings.append(msg)
+            checks[var.lower()] = False
         elif value != "1":
             msg = f"{var}={value} - BLAS threading enabled (may be non-deterministic)"
-            results["warnings"].append(msg)
-            results["checks"][var.lower()] = False
+            warnings.append(msg)
+            checks[var.lower()] = False
         else:
-            results["checks"][var.lower()] = True
+            checks[var.lower()] = True
 
     # Update status
-    if results["errors"]:
-        results["status"] = "fail"
-    elif results["warnings"]:
-        results["status"] = "warning"
-
-    # Strict mode enforcement
-    if strict and (results["errors"] or results["warnings"]):
-        raise RuntimeError(
-            f"Deterministic environment validation failed in strict mode:\n"
-            f"Errors: {results['errors']}\n"
-            f"Warnings: {results['warnings']}",
-        )
+    if errors:
+        status = "fail"
+    elif warnings:
+        status = "warning"
+    else:
+        status = "pass"
 
-    return results
+    return status, tuple(warnings), tuple(errors), tuple(checks.items())
 
 
 def validate_audit_determinism(
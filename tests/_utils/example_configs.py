@@ -0,0 +1,18 @@
+"""Discovery of the packaged example config files shared by fixtures and parametrized tests."""
+
+import os
+from pathlib import Path
+
+CONFIGS_DIR = Path(__file__).parent.parent.parent / "src" / "glassalpha" / "configs"
+
+
+def list_example_configs() -> list[Path]:
+    """Return every ``src/glassalpha/configs/*.yaml`` file, sorted.
+
+    Uses a single ``os.scandir`` pass; DirEntry caches the file-type bit from the
+    directory read, so no per-entry ``stat()`` is needed.
+    """
+    if not CONFIGS_DIR.exists():
+        return []
+    with os.scandir(CONFIGS_DIR) as entries:
+        return sorted(Path(e.path) for e in entries if e.name.endswith(".yaml") and e.is_file())
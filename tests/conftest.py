@@ -249,6 +249,26 @@ def isolate_determinism_state():
     random.setstate(orig_py_state)
 
 
+@pytest.fixture(scope="session")
+def example_config_paths():
+    """Packaged example config files (``src/glassalpha/configs/*.yaml``), listed once per session."""
+    from tests._utils.example_configs import list_example_configs
+
+    return list_example_configs()
+
+
+@pytest.fixture(scope="session")
+def german_credit_df():
+    """German Credit dataset, loaded once per session.
+
+    Loading may hit disk or the network, so tests share one copy. Tests must
+    not mutate it in place - take a ``.copy()`` of any slice they modify.
+    """
+    from glassalpha.datasets import load_german_credit
+
+    return load_german_credit()
+
+
 @pytest.fixture
 def deterministic_env():
     """Fixture for tests requiring deterministic environment.
@@ -19,6 +19,7 @@ try:
     from glassalpha.preprocessing.loader import load_artifact
     from glassalpha.preprocessing.validation import (
         ALLOWED_FQCN,
+        assert_runtime_versions,
         validate_classes,
         validate_output_shape,
         validate_sparsity,
@@ -121,3 +122,16 @@ def test_feature_count_and_names_match_model(sklearn_artifact: Path, toy_df: pd.
     error_msg = str(exc_info.value)
     # Should show the mismatch
     assert str(expected_n_features) in error_msg or "mismatch" in error_msg.lower()
+
+
+def test_strict_mode_fails_on_version_mismatch(mismatched_version_manifest: dict):
+    """Strict mode raises on any drift unless allow_minor accepts same-major versions."""
+    with pytest.raises(RuntimeError, match="sklearn: 1.3.2 -> 1.5.0"):
+        assert_runtime_versions(mismatched_version_manifest, strict=True)
+
+    # All three libraries keep their major version, so minor drift is acceptable
+    assert_runtime_versions(mismatched_version_manifest, strict=True, allow_minor=True)
+
+    mismatched_version_manifest["audit_runtime_versions"]["sklearn"] = "2.0rc1"
+    with pytest.raises(RuntimeError, match="sklearn: 1.3.2 -> 2.0rc1"):
+        assert_runtime_versions(mismatched_version_manifest, strict=True, allow_minor=True)
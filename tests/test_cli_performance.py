@@ -1,6 +1,10 @@
 """Performance regression tests for CLI commands.
 
 Ensures CLI responsiveness for user-facing commands.
+
+Commands are invoked in-process through Typer's CliRunner so the budgets
+measure the command itself rather than interpreter fork+exec. A single
+subprocess smoke test guards true cold-start (import) regressions.
 """
 
 import os
@@ -9,12 +13,48 @@ import sys
 import time
 
 import pytest
+from typer.testing import CliRunner
+
+# Profiled import probe: prints total time, then the top cumulative entries for blame
+_IMPORT_PROFILE_PROBE = """
+import cProfile, io, pstats
+profiler = cProfile.Profile()
+profiler.enable()
+import glassalpha.cli
+profiler.disable()
+stats = pstats.Stats(profiler, stream=io.StringIO())
+print(stats.total_tt)
+stats.stream = out = io.StringIO()
+stats.sort_stats("cumulative").print_stats(10)
+print(out.getvalue())
+"""
+
+# Heavy libraries that must only be imported by commands that actually need them
+_HEAVY_MODULES = ("numpy", "pandas", "sklearn", "xgboost", "lightgbm", "shap")
+
+
+def _invoke_timed(args: list[str], repeat: int = 3) -> tuple[int, float]:
+    """Invoke the CLI in-process and return (exit_code, best elapsed seconds).
+
+    Uses the monotonic perf_counter_ns clock (immune to wall-clock jumps) and
+    keeps the fastest of ``repeat`` runs to filter OS scheduling noise.
+    """
+    from glassalpha.cli import app
+
+    runner = CliRunner()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        result = runner.invoke(app, args)
+        timings.append(time.perf_counter_ns() - start)
+        if result.exit_code != 0:
+            break
+    return result.exit_code, min(timings) / 1e9
 
 
 class TestCLIPerformance:
     """Test CLI command performance to prevent regressions."""
 
-    @pytest.mark.slow
     def test_help_command_performance(self) -> None:
         """Help commands must be <300ms (user perception of instant).
 
@@ -25,91 +65,110 @@ class TestCLIPerformance:
 
         We target <300ms for help commands (no heavy imports).
         """
-        start = time.time()
-        # Ensure UTF-8 encoding for subprocess to handle Unicode in help text
-        env = os.environ.copy()
-        env["LC_ALL"] = "C.UTF-8"
-        env["LANG"] = "C.UTF-8"
-        result = subprocess.run(
-            [sys.executable, "-m", "glassalpha", "--help"],
-            check=False,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            env=env,
-        )
-        elapsed = time.time() - start
+        exit_code, elapsed = _invoke_timed(["--help"])
 
-        assert result.returncode == 0, "Help command should succeed"
+        assert exit_code == 0, "Help command should succeed"
         assert elapsed < 0.3, (
             f"--help took {elapsed:.3f}s (expected <0.3s).\n"
             f"This suggests heavy imports during CLI initialization.\n"
             f"Use lazy imports for numpy, pandas, sklearn, etc."
         )
 
-    @pytest.mark.slow
     def test_audit_help_performance(self) -> None:
         """Audit help command should be fast (<300ms)."""
-        start = time.time()
+        exit_code, elapsed = _invoke_timed(["audit", "--help"])
+
+        assert exit_code == 0, "Audit help should succeed"
+        assert elapsed < 0.3, (
+            f"audit --help took {elapsed:.3f}s (expected <0.3s).\nCommand-specific help should be fast."
+        )
+
+    def test_doctor_command_performance(self) -> None:
+        """Doctor command should complete reasonably fast (<2 seconds)."""
+        exit_code, elapsed = _invoke_timed(["doctor"])
+
+        assert exit_code == 0, "Doctor command should succeed"
+        assert elapsed < 2.0, f"doctor took {elapsed:.3f}s (expected <2.0s).\nEnvironment check should be quick."
+
+    def test_version_command_performance(self) -> None:
+        """Version command should be instant (<100ms)."""
+        exit_code, elapsed = _invoke_timed(["--version"])
+
+        assert exit_code == 0, "Version command should succeed"
+        assert elapsed < 0.1, (
+            f"--version took {elapsed:.3f}s (expected <0.1s).\nVersion should be instant (no imports needed)."
+        )
+
+    @pytest.mark.slow
+    def test_help_cold_start_smoke(self) -> None:
+        """A fresh interpreter running --help must stay under 1s (catches import-time regressions)."""
         # Ensure UTF-8 encoding for subprocess to handle Unicode in help text
         env = os.environ.copy()
         env["LC_ALL"] = "C.UTF-8"
         env["LANG"] = "C.UTF-8"
+        start = time.perf_counter_ns()
         result = subprocess.run(
-            [sys.executable, "-m", "glassalpha", "audit", "--help"],
+            [sys.executable, "-m", "glassalpha", "--help"],
             check=False,
             capture_output=True,
             text=True,
             encoding="utf-8",
             env=env,
         )
-        elapsed = time.time() - start
+        elapsed = (time.perf_counter_ns() - start) / 1e9
 
-        assert result.returncode == 0, "Audit help should succeed"
-        assert elapsed < 0.3, (
-            f"audit --help took {elapsed:.3f}s (expected <0.3s).\nCommand-specific help should be fast."
+        assert result.returncode == 0, "Help command should succeed"
+        assert elapsed < 1.0, (
+            f"Cold-start --help took {elapsed:.3f}s (expected <1.0s).\n"
+            f"This suggests heavy imports during CLI initialization.\n"
+            f"Use lazy imports for numpy, pandas, sklearn, etc."
         )
 
-    @pytest.mark.slow
-    def test_doctor_command_performance(self) -> None:
-        """Doctor command should complete reasonably fast (<2 seconds)."""
-        start = time.time()
-        # Ensure UTF-8 encoding for subprocess to handle Unicode in output
-        env = os.environ.copy()
-        env["LC_ALL"] = "C.UTF-8"
-        env["LANG"] = "C.UTF-8"
+    def test_cli_import_does_not_load_heavy_modules(self) -> None:
+        """Importing glassalpha.cli must not pull in numpy/pandas/sklearn/etc.
+
+        Proactive guard for the lazy-import invariant behind the --help budget.
+        Runs in a fresh interpreter because this test session has already
+        imported the heavy modules.
+        """
+        probe = (
+            f"import sys, glassalpha.cli; print(','.join(sorted(m for m in {_HEAVY_MODULES!r} if m in sys.modules)))"
+        )
         result = subprocess.run(
-            [sys.executable, "-m", "glassalpha", "doctor"],
+            [sys.executable, "-c", probe],
             check=False,
             capture_output=True,
             text=True,
             encoding="utf-8",
-            env=env,
         )
-        elapsed = time.time() - start
 
-        assert result.returncode == 0, "Doctor command should succeed"
-        assert elapsed < 2.0, f"doctor took {elapsed:.3f}s (expected <2.0s).\nEnvironment check should be quick."
+        assert result.returncode == 0, f"Importing glassalpha.cli failed:\n{result.stderr}"
+        eager = result.stdout.strip()
+        assert not eager, (
+            f"glassalpha.cli eagerly imports: {eager}\nMove these imports inside the command functions that use them."
+        )
 
     @pytest.mark.slow
-    def test_version_command_performance(self) -> None:
-        """Version command should be instant (<100ms)."""
-        start = time.time()
-        # Ensure UTF-8 encoding for subprocess to handle Unicode in output
-        env = os.environ.copy()
-        env["LC_ALL"] = "C.UTF-8"
-        env["LANG"] = "C.UTF-8"
+    def test_cli_import_profile_budget(self) -> None:
+        """Profiled import of glassalpha.cli must stay under 300ms.
+
+        Wall-clock budget (inflated by cProfile), so it is marked slow like the
+        cold-start smoke test; the heavy-module guard above enforces the lazy-import
+        invariant deterministically. On failure, reports the top cumulative-time
+        entries to pinpoint the import that added the cost.
+        """
         result = subprocess.run(
-            [sys.executable, "-m", "glassalpha", "--version"],
+            [sys.executable, "-c", _IMPORT_PROFILE_PROBE],
             check=False,
             capture_output=True,
             text=True,
             encoding="utf-8",
-            env=env,
         )
-        elapsed = time.time() - start
 
-        assert result.returncode == 0, "Version command should succeed"
-        assert elapsed < 0.1, (
-            f"--version took {elapsed:.3f}s (expected <0.1s).\nVersion should be instant (no imports needed)."
+        assert result.returncode == 0, f"Profiling glassalpha.cli import failed:\n{result.stderr}"
+        total_line, _, top_entries = result.stdout.partition("\n")
+        total = float(total_line)
+        assert total < 0.3, (
+            f"Importing glassalpha.cli took {total:.3f}s under cProfile (expected <0.3s).\n"
+            f"Top cumulative entries:\n{top_entries}"
         )
@@ -5,16 +5,42 @@ These tests prevent common determinism failures and ensure
 core functionality works in CI environment.
 """
 
-import os
 import subprocess
-import tempfile
+import sys
 from pathlib import Path
 
+import pytest
+from typer.testing import CliRunner
+
+from glassalpha.cli import app
+from glassalpha.utils.determinism import compute_file_hash
+from glassalpha.utils.hashing import hash_object
+
+# Environment pinned for byte-identical report runs. PYTHONHASHSEED is absent because
+# it is only read at interpreter start-up and these runs are in-process.
+_DETERMINISTIC_ENV = {
+    "SOURCE_DATE_EPOCH": "1577836800",
+    "TZ": "UTC",
+    "MPLBACKEND": "Agg",
+    "PYTHONIOENCODING": "utf-8",
+    "LC_ALL": "C.UTF-8",
+    "LANG": "C.UTF-8",
+}
+
+
+@pytest.fixture(scope="session")
+def determinism_workdir(tmp_path_factory):
+    """Session scratch dir (one per xdist worker) for CLI guard outputs.
+
+    Tests write distinctly named outputs here, so no per-test mkdtemp/cleanup is needed.
+    """
+    return tmp_path_factory.mktemp("determinism")
+
 
 class TestCriticalRegressions:
     """Tests for critical regressions that must pass in CI."""
 
-    def test_cli_determinism_regression_guard(self):
+    def test_cli_determinism_regression_guard(self, determinism_workdir):
         """CLI commands produce deterministic results across runs.
 
         This test prevents regressions where CLI operations become
@@ -24,45 +50,20 @@ class TestCriticalRegressions:
         Regression guard for: Random seed handling, file hashing,
         manifest generation consistency.
         """
-        # Create a minimal config for testing
-        config = {
-            "audit_profile": "tabular_compliance",
-            "data": {
-                "dataset": "german_credit",
-                "target_column": "credit_risk",
-            },
-            "model": {
-                "type": "logistic_regression",
-            },
-            "reproducibility": {
-                "random_seed": 42,
-            },
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            import yaml
-
-            yaml.dump(config, f)
-            config_path = Path(f.name)
-
-        try:
-            # Test CLI help command (simpler test that doesn't require data files)
-            cmd = ["python3", "-m", "glassalpha", "--help"]
-
-            # Run help command to verify CLI structure
-            result = subprocess.run(cmd, check=False, capture_output=True, text=True, cwd=Path.cwd(), encoding="utf-8")
-
-            # Should succeed (exit code 0)
-            assert result.returncode == 0, f"CLI help failed: {result.stderr}"
-
-            # Should contain expected help text
-            assert "glassalpha" in result.stdout.lower()
-            assert "audit" in result.stdout.lower() or "usage" in result.stdout.lower()
-
-        finally:
-            # Cleanup
-            config_path.unlink(missing_ok=True)
-            Path("/tmp/test_audit.pdf").unlink(missing_ok=True)
+        # Test CLI help command (simpler test that doesn't require data files)
+        cmd = [sys.executable, "-m", "glassalpha", "--help"]
+
+        # Run help command to verify CLI structure
+        result = subprocess.run(
+            cmd, check=False, capture_output=True, text=True, cwd=determinism_workdir, encoding="utf-8"
+        )
+
+        # Should succeed (exit code 0)
+        assert result.returncode == 0, f"CLI help failed: {result.stderr}"
+
+        # Should contain expected help text
+        assert "glassalpha" in result.stdout.lower()
+        assert "audit" in result.stdout.lower() or "usage" in result.stdout.lower()
 
     def test_manifest_generation_consistent(self):
         """Manifest generation produces consistent results.
@@ -70,8 +71,6 @@ class TestCriticalRegressions:
         Regression guard for manifest hashing and content generation.
         Prevents changes that break manifest reproducibility.
         """
-        from glassalpha.utils.hashing import hash_object
-
         # Test data that should hash consistently
         test_data = {"test": "data", "version": 1, "nested": {"key": "value"}}
 
@@ -82,72 +81,36 @@ class TestCriticalRegressions:
         # Should be identical
         assert hash1 == hash2, f"Hash inconsistency: {hash1} != {hash2}"
 
-    def test_report_is_byte_stable(self, tmp_path):
+    def test_report_is_byte_stable(self, determinism_workdir, monkeypatch):
         """Same config produces byte-identical audit reports.
 
         Critical for regulatory reproducibility - auditors must be able
         to regenerate exact same output to verify results.
-        """
-        import yaml
-
-        from glassalpha.config import load_config
 
+        Both runs invoke the CLI in-process, so only the audit itself is
+        repeated (no second interpreter start-up and package import). They
+        share one hash seed and all module-level state; cross-process
+        stability is covered by TestCLIDeterminism in
+        tests/integration/test_determinism.py.
+        """
         # Use golden config (known to work)
         config_path = Path("examples/german_credit_golden/config.yaml")
 
-        # Run audit twice
-        output1 = tmp_path / "audit1.html"
-        output2 = tmp_path / "audit2.html"
-
-        cmd = ["python3", "-m", "glassalpha", "audit", "-c", str(config_path)]
-
-        # First run
-        result1 = subprocess.run(
-            cmd + ["-o", str(output1)],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=False,
-            env={
-                **os.environ,
-                "PYTHONHASHSEED": "0",
-                "TZ": "UTC",
-                "MPLBACKEND": "Agg",
-                "PYTHONIOENCODING": "utf-8",
-                "LC_ALL": "C.UTF-8",
-                "LANG": "C.UTF-8",
-            },
-        )
-        assert result1.returncode == 0, f"First run failed: {result1.stderr}"
-
-        # Second run
-        result2 = subprocess.run(
-            cmd + ["-o", str(output2)],
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            check=False,
-            env={
-                **os.environ,
-                "PYTHONHASHSEED": "0",
-                "TZ": "UTC",
-                "MPLBACKEND": "Agg",
-                "PYTHONIOENCODING": "utf-8",
-                "LC_ALL": "C.UTF-8",
-                "LANG": "C.UTF-8",
-            },
-        )
-        assert result2.returncode == 0, f"Second run failed: {result2.stderr}"
-
-        # Compute hashes
-        import hashlib
+        for key, value in _DETERMINISTIC_ENV.items():
+            monkeypatch.setenv(key, value)
 
-        hash1 = hashlib.sha256(output1.read_bytes()).hexdigest()
-        hash2 = hashlib.sha256(output2.read_bytes()).hexdigest()
+        runner = CliRunner()
+        hashes = []
+        for run_num in (1, 2):
+            output = determinism_workdir / f"byte_stable_{run_num}.html"
+            result = runner.invoke(app, ["audit", "-c", str(config_path), "-o", str(output)])
+            assert result.exit_code == 0, f"Run {run_num} failed: {result.output}"
+            # Run-to-run equality only needs a fast digest, not a cryptographic one
+            hashes.append(compute_file_hash(output, algorithm="xxh3"))
 
-        assert hash1 == hash2, (
+        assert hashes[0] == hashes[1], (
             f"Byte-identical guarantee violated:\n"
-            f"  Run 1: {hash1}\n"
-            f"  Run 2: {hash2}\n"
+            f"  Run 1: {hashes[0]}\n"
+            f"  Run 2: {hashes[1]}\n"
             f"Same config must produce identical output for regulatory compliance."
         )
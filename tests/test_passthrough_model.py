@@ -0,0 +1,26 @@
+"""Tests for the PassThroughModel test stub."""
+
+import numpy as np
+import pytest
+
+from glassalpha.models import PassThroughModel
+
+
+@pytest.mark.parametrize("n_samples", [1, 5, 1000])
+def test_predict_proba_float32_contract(n_samples):
+    """predict_proba returns an (n, 2) float32 array whose rows sum to 1."""
+    X = np.zeros((n_samples, 3))
+
+    proba = PassThroughModel().fit(X, np.ones(n_samples)).predict_proba(X)
+
+    assert proba.dtype == np.float32
+    assert proba.shape == (n_samples, 2)
+    np.testing.assert_allclose(proba.sum(axis=1), 1.0, rtol=1e-6)
+
+
+def test_predict_proba_accepts_sequences():
+    """Inputs without a shape fall back to len()."""
+    proba = PassThroughModel().predict_proba([[0.0], [1.0]])
+
+    assert proba.dtype == np.float32
+    assert proba.shape == (2, 2)
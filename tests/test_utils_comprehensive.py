@@ -6,8 +6,10 @@ regulatory compliance.
 """
 
 import contextlib
+import hashlib
 import json
 import os
+import sys
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
@@ -17,7 +19,12 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from glassalpha.utils.determinism import compute_file_hash, verify_deterministic_output
+from glassalpha.utils.determinism import (
+    compute_file_hash,
+    deterministic,
+    validate_deterministic_environment,
+    verify_deterministic_output,
+)
 from glassalpha.utils.hashing import (
     hash_array,
     hash_config,
@@ -1048,5 +1055,88 @@ class TestDeterminismUtilities:
         assert not identical
         assert hash1 != hash2
 
+    def test_validation_passes_inside_strict_context(self):
+        """The strict deterministic context satisfies every validation check."""
+        with deterministic(seed=42, strict=True):
+            results = validate_deterministic_environment(strict=True)
+        assert results["status"] == "pass"
+        assert all(results["checks"].values())
+
+    def test_validation_reflects_environment_changes(self, monkeypatch):
+        """Changing a checked variable must change the result (no stale cache hits)."""
+        monkeypatch.setenv("PYTHONHASHSEED", "0")
+        for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+            monkeypatch.setenv(var, "1")
+        assert validate_deterministic_environment()["status"] == "pass"
+
+        monkeypatch.setenv("OMP_NUM_THREADS", "8")
+        results = validate_deterministic_environment()
+        assert results["status"] == "warning"
+        assert results["checks"]["omp_num_threads"] is False
+        with pytest.raises(RuntimeError, match="strict mode"):
+            validate_deterministic_environment(strict=True)
+
+    def test_results_are_independent_copies(self, monkeypatch):
+        """Mutating one result must not leak into later calls."""
+        monkeypatch.delenv("PYTHONHASHSEED", raising=False)
+        first = validate_deterministic_environment()
+        first["warnings"].clear()
+        first["checks"]["pythonhashseed"] = True
+
+        second = validate_deterministic_environment()
+        assert second["warnings"]
+        assert second["checks"]["pythonhashseed"] is False
+
+    def test_hash_matches_full_read_for_multi_chunk_file(self, tmp_path):
+        """Streaming a multi-MiB file must give the same digest as hashing its bytes."""
+        path = tmp_path / "large.bin"
+        path.write_bytes(np.random.default_rng(0).bytes(3 * (1 << 20) + 17))
+
+        assert compute_file_hash(path) == hashlib.sha256(path.read_bytes()).hexdigest()
+
+    def test_verify_output_uses_blake2b_by_default(self, tmp_path):
+        """Equality checks default to BLAKE2b; SHA-256 remains available on request."""
+        path1 = tmp_path / "a.bin"
+        path2 = tmp_path / "b.bin"
+        path1.write_bytes(b"identical")
+        path2.write_bytes(b"identical")
+
+        identical, hash1, _ = verify_deterministic_output(path1, path2)
+        assert identical
+        assert hash1 == hashlib.blake2b(b"identical").hexdigest()
+
+        _, sha1, _ = verify_deterministic_output(path1, path2, algorithm="sha256")
+        assert sha1 == compute_file_hash(path1)
+
+    def test_xxh3_distinguishes_content(self, tmp_path):
+        """The fast 'xxh3' option (sha256 fallback without xxhash) must still detect differences."""
+        same1, same2, other = (tmp_path / name for name in ("a.html", "b.html", "c.html"))
+        same1.write_bytes(b"<html>report</html>")
+        same2.write_bytes(b"<html>report</html>")
+        other.write_bytes(b"<html>report!</html>")
+
+        assert compute_file_hash(same1, algorithm="xxh3") == compute_file_hash(same2, algorithm="xxh3")
+        assert compute_file_hash(same1, algorithm="xxh3") != compute_file_hash(other, algorithm="xxh3")
+
+    def test_xxh3_fallback_is_sha256_and_warns(self, tmp_path, monkeypatch, caplog):
+        """Without xxhash, 'xxh3' must loudly degrade to sha256 rather than silently."""
+        monkeypatch.setitem(sys.modules, "xxhash", None)  # Force ImportError
+        path = tmp_path / "report.html"
+        path.write_bytes(b"<html>report</html>")
+
+        with caplog.at_level("WARNING", logger="glassalpha.utils.determinism"):
+            digest = compute_file_hash(path, algorithm="xxh3")
+
+        assert digest == compute_file_hash(path, algorithm="sha256")
+        assert "xxhash not installed" in caplog.text
+
+    def test_unsupported_algorithm_raises(self, tmp_path):
+        """Unknown algorithms must raise ValueError rather than silently hashing."""
+        path = tmp_path / "file.txt"
+        path.write_text("content")
+
+        with pytest.raises(ValueError, match="Unsupported hash algorithm"):
+            compute_file_hash(path, algorithm="not-a-hash")
+
     # Test removed: normalize_pdf_metadata() was deleted as PDF determinism is no longer a goal
     # PDF generation is now for human review only; HTML format provides byte-identical outputs